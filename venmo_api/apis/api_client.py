@@ -1,13 +1,14 @@
 import os
-import uuid
-from json import JSONDecodeError
+from collections.abc import Container
 from random import getrandbits
 
 import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from venmo_api import PROJECT_ROOT
-from venmo_api.apis.api_util import ValidatedResponse
+from venmo_api.apis.api_util import ValidatedResponse, parse_body
 from venmo_api.apis.exception import (
     HttpCodeError,
     InvalidHttpMethodError,
@@ -15,6 +16,32 @@ from venmo_api.apis.exception import (
 )
 from venmo_api.apis.logging_session import LoggingSession
 
+# parsed once at import and seeded into each ApiClient's session headers. Values are
+# kept pre-encoded, since http.client passes bytes header values straight through.
+_DEFAULT_HEADERS = {
+    k: v.encode("latin-1")
+    for k, v in orjson.loads(
+        (PROJECT_ROOT / "default_headers.json").read_bytes()
+    ).items()
+}
+# one keep-alive pool for every ApiClient, so e.g. log_out's throwaway client reuses
+# open connections. Only GETs are retried, and only on gateway errors: a 429 means
+# we're already hitting Venmo too fast (which can get the account locked), and PUT
+# remind/cancel or POST payments must never be resent. The last response is returned
+# rather than raising RetryError, so _validate_response still raises HttpCodeError.
+_SHARED_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(("GET",)),
+        raise_on_status=False,
+    ),
+)
+_VALID_METHODS = frozenset(("POST", "PUT", "GET", "DELETE"))
+
 
 def random_device_id() -> str:
     """
@@ -22,7 +49,16 @@ def random_device_id() -> str:
     NOTE: As of late 2025, they seem to have tightened security around device-ids, so
     that randomly generated ones aren't accepted.
     """
-    return str(uuid.uuid4()).upper()
+    return random_uuid4().upper()
+
+
+def random_uuid4() -> str:
+    """Random version 4 UUID string, formatted straight from os.urandom bytes."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
 
 
 class ApiClient:
@@ -36,17 +72,30 @@ class ApiClient:
         device_id (str | None, optional): unique device ID. Defaults to None, in
             which case a random one is generated. FYI I don't think random ids work
             anymore.
+        session (requests.Session | None, optional): session to send requests with.
+            Defaults to None, in which case a new one is created on top of a connection
+            pool shared by all ApiClients.
     """
 
-    def __init__(self, access_token: str | None = None, device_id: str | None = None):
-        self.default_headers = orjson.loads(
-            (PROJECT_ROOT / "default_headers.json").read_bytes()
-        )
-        if os.getenv("LOGGING_SESSION"):
-            self.session = LoggingSession()
+    def __init__(
+        self,
+        access_token: str | None = None,
+        device_id: str | None = None,
+        session: requests.Session | None = None,
+    ):
+        # only a session created here is ours to close
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
         else:
-            self.session = requests.Session()
-        self.session.headers.update(self.default_headers)
+            if os.getenv("LOGGING_SESSION"):
+                self.session = LoggingSession()
+            else:
+                self.session = requests.Session()
+            # sessions hold per-client auth headers so can't be shared, but the
+            # connection pool underneath them can
+            self.session.mount("https://", _SHARED_ADAPTER)
+        self.session.headers.update(_DEFAULT_HEADERS)
 
         self.access_token = access_token
         if access_token:
@@ -59,21 +108,43 @@ class ApiClient:
 
         self.update_session_id()
         self.configuration = {"host": "https://api.venmo.com/v1"}
+        self._host = self.configuration["host"]
+
+    @property
+    def host(self) -> str:
+        """Base URL that resource paths are appended to."""
+        return self._host
+
+    def _set_header(self, name: str, value: str):
+        self.session.headers[name] = value.encode("latin-1")
 
     def update_session_id(self):
         self._session_id = str(getrandbits(64))
-        self.default_headers.update({"X-Session-ID": self._session_id})
-        self.session.headers.update({"X-Session-ID": self._session_id})
+        self._set_header("X-Session-ID", self._session_id)
 
     def update_access_token(self, access_token: str):
         self.access_token = access_token
-        self.default_headers.update({"Authorization": "Bearer " + self.access_token})
-        self.session.headers.update({"Authorization": "Bearer " + self.access_token})
+        self._set_header("Authorization", "Bearer " + access_token)
 
     def update_device_id(self, device_id: str):
         self.device_id = device_id
-        self.default_headers.update({"device-id": self.device_id})
-        self.session.headers.update({"device-id": self.device_id})
+        self._set_header("device-id", device_id)
+
+    # context manager dunder methods for `with` block session cleanup
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the underlying session, unless it was passed in by the caller, who
+        still owns it. The shared connection pool is left open for other ApiClients."""
+        if not self._owns_session:
+            return
+        if self.session.adapters.get("https://") is _SHARED_ADAPTER:
+            del self.session.adapters["https://"]
+        self.session.close()
 
     def call_api(
         self,
@@ -82,7 +153,7 @@ class ApiClient:
         headers: dict = None,
         params: dict = None,
         body: dict = None,
-        ok_error_codes: list[int] = None,
+        ok_error_codes: Container[int] | None = None,
     ) -> ValidatedResponse:
         """Calls API on the provided path
 
@@ -94,11 +165,12 @@ class ApiClient:
             query_params (dict, optional): endpoint query parameters. Defaults to None.
             body (dict, optional): JSON payload to send if request is POST/PUT. Defaults
                 to None.
-            ok_error_codes (list[int], optional): Expected integer error codes that will be
-                handled by calling code and which shouldn't raise. Defaults to None.
+            ok_error_codes (Container[int], optional): Expected integer error codes that
+                will be handled by calling code and which shouldn't raise. A frozenset
+                built once by the caller is ideal. Defaults to None.
 
         Returns:
-            ValidatedResponse
+            ValidatedResponse: validated response.
         """
 
         # Update the header with the required values
@@ -106,38 +178,59 @@ class ApiClient:
 
         if body:  # POST or PUT
             headers.update({"Content-Type": "application/json; charset=utf-8"})
-        url = self.configuration["host"] + resource_path
+        url = f"{self._host}{resource_path}"
 
-        if method not in ["POST", "PUT", "GET", "DELETE"]:
+        if method not in _VALID_METHODS:
             raise InvalidHttpMethodError()
 
+        # serialize with orjson rather than letting requests use the stdlib json module
+        data = orjson.dumps(body) if body else None
         response = self.session.request(
-            method=method, url=url, headers=headers, params=params, json=body
+            method=method, url=url, headers=headers, params=params, data=data
         )
         validated_response = self._validate_response(response, ok_error_codes)
         return validated_response
 
+    def get(self, resource_path: str, params: dict = None) -> ValidatedResponse:
+        """GET the provided path. Same as
+        `call_api(resource_path, "GET", params=params)` minus the header/body handling,
+        which is dead weight for plain reads.
+
+        Args:
+            resource_path (str): Specific Venmo API path endpoint.
+            params (dict, optional): endpoint query parameters. Defaults to None.
+
+        Returns:
+            ValidatedResponse: the validated response.
+        """
+        response = self.session.get(f"{self._host}{resource_path}", params=params)
+        return self._validate_response(response)
+
     @staticmethod
     def _validate_response(
-        response: requests.Response, ok_error_codes: list[int] = None
+        response: requests.Response, ok_error_codes: Container[int] | None = None
     ) -> ValidatedResponse:
         """
-        Validate and build a new validated response.
+        Validate and build a new validated response
         """
-        headers = response.headers
-        try:
-            body = response.json()
-        except JSONDecodeError:
-            body = {}
-
-        built_response = ValidatedResponse(response.status_code, headers, body)
-
-        if response.status_code in range(200, 205) or (
-            body and ok_error_codes and body.get("error").get("code") in ok_error_codes
-        ):
-            return built_response
-
-        elif response.status_code == 400 and body.get("error").get("code") == 283:
+        status_code = response.status_code
+        if 200 <= status_code < 205:
+            # body is parsed lazily, on first access
+            return ValidatedResponse(
+                status_code, response.headers, raw=response.content
+            )
+
+        # error bodies are small, so just parse them and read the top-level code
+        body = parse_body(response.content)
+        error = body.get("error") if isinstance(body, dict) else None
+        error_code = error.get("code") if isinstance(error, dict) else None
+
+        if ok_error_codes and error_code in ok_error_codes:
+            return ValidatedResponse(
+                status_code, response.headers, body, raw=response.content
+            )
+
+        elif status_code == 400 and error_code == 283:
             raise ResourceNotFoundError()
 
         else:
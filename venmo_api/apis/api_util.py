@@ -1,18 +1,57 @@
-from dataclasses import dataclass
-from enum import Enum
+from collections.abc import Callable, Iterator, Mapping
+from functools import lru_cache
 from typing import Any
 
-from pydantic import BaseModel
-from requests.structures import CaseInsensitiveDict
+import orjson
+from pydantic import BaseModel, TypeAdapter, create_model
 
 from venmo_api.models.page import Page
 
 
-@dataclass(frozen=True, slots=True)
+def parse_body(raw: bytes) -> dict | list:
+    """Parse a raw response body, treating empty or invalid JSON as an empty dict."""
+    if not raw:  # e.g. 204 No Content, skip raising and catching a decode error
+        return {}
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return {}
+
+
 class ValidatedResponse:
-    status_code: int
-    headers: CaseInsensitiveDict
-    body: dict
+    """Response that passed status/error-code validation. `body` is only parsed from
+    `raw` on first access, so `deserialize_json` can validate straight from the bytes.
+    """
+
+    __slots__ = ("status_code", "headers", "raw", "_body")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        body: dict | list | None = None,
+        raw: bytes = b"",
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.raw = raw
+        self._body = body
+
+    @property
+    def body(self) -> dict | list:
+        if self._body is None:
+            self._body = parse_body(self.raw)
+        return self._body
+
+    @property
+    def body_parsed(self) -> bool:
+        return self._body is not None
+
+    def __repr__(self) -> str:
+        return (
+            f"ValidatedResponse(status_code={self.status_code!r}, "
+            f"headers={self.headers!r}, body={self.body!r})"
+        )
 
 
 def deserialize(
@@ -37,46 +76,153 @@ def deserialize(
         raise Exception("Can't get an empty response body.")
 
     data = body.get("data")
-    nested_response = nested_response or []
-    for nested in nested_response:
-        temp = data.get(nested)
-        if not temp:
-            raise ValueError(f"Couldn't find {nested} in the {data}.")
-        data = temp
+    if nested_response:
+        try:
+            data = _resolver(tuple(nested_response))(data)
+        except (KeyError, TypeError):
+            raise ValueError(f"Couldn't find {nested_response} in the {data}.")
+
+    is_model = isinstance(data_type, type) and issubclass(data_type, BaseModel)
 
     # Return a list of <class> data_type
     if isinstance(data, list):
-        return __get_objs_from_json_list(json_list=data, data_type=data_type)
+        if is_model:
+            return _page_of_models(data, data_type)
+        return _page_of_primitives(data, data_type)
 
-    if issubclass(data_type, BaseModel):
-        return data_type.model_validate(data)
+    if is_model:
+        return _validator(data_type)(data)
     else:  # probably a primitive
         return data_type(data)
 
 
-def __get_objs_from_json_list(
-    json_list: list[Any], data_type: type[BaseModel | Any]
-) -> Page[Any]:
-    """Process response JSON for a data list.
+def deserialize_lazy(
+    response: ValidatedResponse, data_type: type[BaseModel]
+) -> Iterator[BaseModel]:
+    """Like `deserialize` for a list response, but validates each element only as it's
+    iterated, so callers searching for one object can stop early.
+
+    Args:
+        response (ValidatedResponse): validated response whose `data` is a list.
+        data_type (type[BaseModel]): pydantic model of the list elements.
+
+    Yields:
+        BaseModel: one validated object per list element.
+    """
+    body = response.body
+    if not body:
+        raise Exception("Can't get an empty response body.")
+
+    return map(_validator(data_type), body.get("data") or [])
+
+
+def deserialize_json(
+    response: ValidatedResponse,
+    data_type: type[BaseModel],
+    nested_response: list[str] | None = None,
+    many: bool = False,
+) -> Any | Page[Any]:
+    """Like `deserialize`, but validates the model(s) straight from the raw response
+    bytes, so the body is never also built as a dict. Only for pydantic models, and the
+    caller says up front whether `data` holds one object or a list (`many`). Falls back
+    to `deserialize` if the body was already parsed, since the dict is then free.
+
+    Args:
+        response (ValidatedResponse): validated response.
+        data_type (type[BaseModel]): pydantic model to validate.
+        nested_response (list[str] | None, optional): keys to walk into `data`.
+            Defaults to None.
+        many (bool, optional): whether the target is a list of objects. Defaults to
+            False.
+
+    Returns:
+        Any | Page[Any]: a single <Object>, or a <Page> of them if `many`.
+    """
+    if response.body_parsed:
+        return deserialize(response, data_type, nested_response)
+    if not response.raw:
+        raise Exception("Can't get an empty response body.")
+
+    keys = ("data", *(nested_response or ()))
+    envelope = _envelope_adapter(keys, list[data_type] if many else data_type)
+    data = envelope.validate_json(response.raw)
+    for key in keys:
+        data = getattr(data, key)
+
+    if many:
+        result = Page()
+        result.extend(data)
+        return result
+    return data
+
+
+@lru_cache(maxsize=None)
+def _envelope_adapter(keys: tuple[str, ...], inner: Any) -> TypeAdapter:
+    """Cached validator for `{keys[0]: {keys[1]: ... inner}}`, ignoring sibling keys."""
+    for i, key in enumerate(reversed(keys)):
+        inner = create_model(f"_Envelope{i}", **{key: (inner, ...)})
+    return TypeAdapter(inner)
+
+
+@lru_cache(maxsize=None)
+def _resolver(keys: tuple[str, ...]) -> Callable[[dict], Any]:
+    """Cached function that walks a fixed path of keys into nested response data."""
+
+    def resolve(data: dict) -> Any:
+        for key in keys:
+            data = data[key]
+        return data
+
+    return resolve
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(data_type: type[BaseModel]) -> TypeAdapter:
+    """Cached list validator for a model, so a whole page validates in one core call."""
+    return TypeAdapter(list[data_type])
+
+
+@lru_cache(maxsize=None)
+def _validator(data_type: type[BaseModel]) -> Callable[[Any], BaseModel]:
+    """Cached bound pydantic-core validator for a model, skipping the python-level
+    `model_validate` wrapper on single items.
+    """
+    return data_type.__pydantic_validator__.validate_python
+
+
+def _page_of_models(json_list: list[Any], data_type: type[BaseModel]) -> Page[Any]:
+    """Process response JSON for a list of json objects.
 
     Args:
         json_list (list[Any]): a list of objs
-        data_type (type[BaseModel  |  Any]): User/Transaction/Payment/PaymentMethod
+        data_type (type[BaseModel]): User/Transaction/Payment/PaymentMethod
 
     Returns:
         Page[Any]: list subclass container that can get its own next page.
     """
     result = Page()
-    for elem in json_list:
-        if issubclass(data_type, BaseModel):
-            result.append(data_type.model_validate(elem))
-        else:  # probably a primitive
-            result.append(data_type(elem))
+    result.extend(_list_adapter(data_type).validate_python(json_list))
+    return result
+
+
+def _page_of_primitives(json_list: list[Any], data_type: type) -> Page[Any]:
+    """Process response JSON for a list of primitives.
+
+    Args:
+        json_list (list[Any]): a list of primitive values
+        data_type (type): primitive class to convert each value with
 
+    Returns:
+        Page[Any]: list subclass container that can get its own next page.
+    """
+    result = Page()
+    result.extend(map(data_type, json_list))
     return result
 
 
-class Colors(Enum):
+class Colors:
+    """ANSI escape codes, as plain strings."""
+
     HEADER = "\033[95m"
     OKBLUE = "\033[94m"
     OKGREEN = "\033[92m"
@@ -91,11 +237,11 @@ def warn(message):
     """
     print message in Red Color
     """
-    print(Colors.WARNING.value + message + Colors.ENDC.value)
+    print(f"{Colors.WARNING}{message}{Colors.ENDC}")
 
 
 def confirm(message):
     """
     print message in Blue Color
     """
-    print(Colors.OKBLUE.value + message + Colors.ENDC.value)
+    print(f"{Colors.OKBLUE}{message}{Colors.ENDC}")
@@ -1,6 +1,12 @@
+from collections import deque
+
 from venmo_api.apis.api_client import ApiClient
 from venmo_api.apis.api_util import ValidatedResponse, confirm, warn
-from venmo_api.apis.exception import AuthenticationFailedError
+from venmo_api.apis.exception import (
+    AuthenticationFailedError,
+    HttpCodeError,
+    ResourceNotFoundError,
+)
 
 # NOTE: ApiClient owns device-id now
 
@@ -14,9 +20,12 @@ class AuthenticationApi:
     """
 
     TWO_FACTOR_ERROR_CODE = 81109
+    _LOGIN_OK_ERROR_CODES = frozenset((TWO_FACTOR_ERROR_CODE,))
 
     def __init__(self, api_client: ApiClient):
         self._api_client = api_client
+        # OTPs already submitted, so a re-entered one is rejected without a round trip
+        self._used_otps: deque[str] = deque(maxlen=8)
 
     def login_with_credentials_cli(self, username: str, password: str) -> str:
         """Pass your username and password to get an access_token for using the API.
@@ -77,7 +86,7 @@ class AuthenticationApi:
             resource_path="/oauth/access_token",
             body=body,
             method="POST",
-            ok_error_codes=[self.TWO_FACTOR_ERROR_CODE],
+            ok_error_codes=self._LOGIN_OK_ERROR_CODES,
         )
 
     @staticmethod
@@ -90,8 +99,8 @@ class AuthenticationApi:
         Returns:
             bool: True or raises exception.
         """
-        api_client = ApiClient(access_token=access_token)
-        api_client.call_api(resource_path="/oauth/access_token", method="DELETE")
+        with ApiClient(access_token=access_token) as api_client:
+            api_client.call_api(resource_path="/oauth/access_token", method="DELETE")
         confirm("Successfully logged out.")
         return True
 
@@ -159,16 +168,29 @@ class AuthenticationApi:
             user_otp (str): otp user received on their phone
             otp_secret (str): otp_secret obtained from 2-factor process
 
+        Raises:
+            AuthenticationFailedError: if this OTP was already submitted.
+
         Returns:
-            str: _description_
+            str: access token generated for this session
         """
+        if user_otp in self._used_otps:
+            raise AuthenticationFailedError("OTP already used, request a new one.")
+
         headers = {"venmo-otp": user_otp, "venmo-otp-secret": otp_secret}
-        response = self._api_client.call_api(
-            resource_path="/oauth/access_token",
-            headers=headers,
-            params={"client_id": 1},
-            method="POST",
-        )
+        try:
+            response = self._api_client.call_api(
+                resource_path="/oauth/access_token",
+                headers=headers,
+                params={"client_id": 1},
+                method="POST",
+            )
+        except (HttpCodeError, ResourceNotFoundError):
+            # the server saw and rejected it, so it's spent. A transport error means
+            # it never arrived, and the same OTP can be retried.
+            self._used_otps.append(user_otp)
+            raise
+        self._used_otps.append(user_otp)
         return response.body["access_token"]
 
     def trust_this_device(self):
@@ -186,10 +208,9 @@ class AuthenticationApi:
 
     @staticmethod
     def _ask_user_for_otp_password():
-        otp = ""
-        while len(otp) < 6 or not otp.isdigit():
+        while True:
             otp = input(
                 "Enter OTP that you received on your phone from Venmo: (It must be 6 digits)\n"
-            )
-
-        return otp
+            ).strip()
+            if len(otp) == 6 and otp.isascii() and otp.isdigit():
+                return otp
@@ -1,5 +1,7 @@
 from json import JSONDecodeError
 
+import orjson
+
 # ======= Authentication Exceptions =======
 
 
@@ -44,7 +46,7 @@ class HttpCodeError(Exception):
         status_code = response.status_code or "NA"
         reason = response.reason or "Unknown reason"
         try:
-            json = response.json()
+            json = orjson.loads(response.content)
         except JSONDecodeError:
             json = "Invalid Json"
 
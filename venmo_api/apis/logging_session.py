@@ -1,58 +1,114 @@
+import logging
+from collections.abc import Mapping
+
 import orjson
-from devtools import pformat
 from requests import PreparedRequest, Response, Session
-from rich import print
+from rich.logging import RichHandler
 
 MAX_BODY_LOG = 1024 * 100  # 100 KB limit to avoid OOM in logs; tweak as needed
 
+logger = logging.getLogger(__name__)
+
 
 def safe_text(b: bytes | None, fallback_repr=True) -> str:
+    """Render a raw body for logging, pretty-printing it if it's JSON."""
     if b is None:
         return "None"
+    truncated = len(b) > MAX_BODY_LOG
+    if not truncated:
+        try:
+            return orjson.dumps(orjson.loads(b), option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONDecodeError:
+            pass
+    # decode the logged prefix through a memoryview, so a large body isn't copied first
+    head = memoryview(b)[:MAX_BODY_LOG]
     try:
-        text = b.decode("utf-8")
-        if len(text) <= MAX_BODY_LOG:
-            return orjson.loads(text)
+        text = str(head, "utf-8")
+    except UnicodeDecodeError as e:
+        # the cut may land inside a multibyte character; anything else is binary
+        if truncated and e.reason == "unexpected end of data":
+            text = str(head[: e.start], "utf-8")
+        elif fallback_repr:
+            return repr(head.tobytes()) + ("...TRUNCATED..." if truncated else "")
         else:
-            return text[:MAX_BODY_LOG] + "\n...TRUNCATED..."
-    except Exception:
-        if fallback_repr:
-            return repr(b[:MAX_BODY_LOG]) + (
-                "...TRUNCATED..." if len(b) > MAX_BODY_LOG else ""
-            )
-        return "<binary>"
+            return "<binary>"
+    # JSON was already tried above
+    return text + "\n...TRUNCATED..." if truncated else text
+
+
+def safe_text_str(text: str) -> str:
+    """Same as `safe_text` for a body that's already a str, without re-encoding it."""
+    if len(text) <= MAX_BODY_LOG:
+        try:
+            return orjson.dumps(orjson.loads(text), option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONDecodeError:
+            return text
+    return text[:MAX_BODY_LOG] + "\n...TRUNCATED..."
+
+
+def _format_headers(headers: Mapping) -> str:
+    """One `name: value` line per header, read straight off the mapping."""
+    return "\n".join(
+        f"  {name}: {value.decode('latin-1') if isinstance(value, bytes) else value}"
+        for name, value in headers.items()
+    )
 
 
 class LoggingSession(Session):
     """
-    requests.Session subclass that pretty-logs its requests and responses using
-    rich.print
+    requests.Session subclass that pretty-logs its requests and responses at DEBUG
+    level. If nothing else has configured the `venmo_api.apis.logging_session` logger,
+    a rich handler at DEBUG is attached so output shows up like it used to. All the
+    formatting work is skipped whenever DEBUG isn't enabled.
     """
 
+    def __init__(self):
+        super().__init__()
+        if not logger.handlers:
+            logger.addHandler(RichHandler(show_time=False, show_path=False))
+            logger.setLevel(logging.DEBUG)
+            # the rich handler already prints everything, don't repeat it at the root
+            logger.propagate = False
+
     def send(self, request: PreparedRequest, **kwargs) -> Response:
-        print(f"\n→ REQUEST: {request.method} {request.url}")
-        print(f"→ Request headers: {pformat(dict(request.headers))}")
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_request(request)
+
+        resp = super().send(request, **kwargs)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_response(resp, streamed=kwargs.get("stream", False))
+
+        return resp
+
+    @staticmethod
+    def _log_request(request: PreparedRequest):
+        logger.debug(f"→ REQUEST: {request.method} {request.url}")
+        logger.debug(f"→ Request headers:\n{_format_headers(request.headers)}")
 
         body = request.body
         if isinstance(body, str):
-            print(f"→ Request body (str): {pformat(safe_text(body.encode()))}")
+            logger.debug(f"→ Request body (str): {safe_text_str(body)}")
         elif isinstance(body, bytes):
-            print(f"→ Request body (bytes): {pformat(safe_text(body))}")
+            logger.debug(f"→ Request body (bytes): {safe_text(body)}")
         elif body is None:
-            print("→ Request body: None")
+            logger.debug("→ Request body: None")
         else:
             # could be generator/iterable (multipart streaming)
-            print(f"→ Request body: (type={type(body).__name__}) {repr(body)}")
+            logger.debug(f"→ Request body: (type={type(body).__name__}) {repr(body)}")
 
-        resp = super().send(request, **kwargs)
+    @staticmethod
+    def _log_response(resp: Response, streamed: bool = False):
+        logger.debug(f"← RESPONSE: {resp.status_code} {resp.reason}")
+        logger.debug(f"← Response headers:\n{_format_headers(resp.headers)}")
 
-        print(f"← RESPONSE: {resp.status_code} {resp.reason}")
-        print(f"← Response headers: {pformat(dict(resp.headers))}")
+        if streamed:
+            # reading it here would buffer the whole body and defeat the caller's stream
+            logger.debug("← Response body: <streamed, not logged>")
+            return
 
         try:
             content = resp.content
-            print(f"← Response body: {pformat(safe_text(content))}")
+            logger.debug(f"← Response body: {safe_text(content)}")
         except Exception as e:
-            print(f"← Response body: <unreadable: {e}>")
-
-        return resp
+            logger.debug(f"← Response body: <unreadable: {e}>")
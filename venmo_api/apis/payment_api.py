@@ -1,15 +1,25 @@
-import uuid
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from decimal import ROUND_HALF_UP, Decimal
 from typing import Literal
 
-from venmo_api.apis.api_client import ApiClient
-from venmo_api.apis.api_util import ValidatedResponse, deserialize
+from venmo_api.apis.api_client import ApiClient, random_uuid4
+from venmo_api.apis.api_util import (
+    ValidatedResponse,
+    deserialize,
+    deserialize_lazy,
+    warn,
+)
 from venmo_api.apis.exception import (
     AlreadyRemindedPaymentError,
     GeneralPaymentError,
+    HttpCodeError,
     NoPaymentMethodFoundError,
     NoPendingPaymentToUpdateError,
     NotEnoughBalanceError,
 )
+from venmo_api.apis.user_api import UserApi
 from venmo_api.models.page import Page
 from venmo_api.models.payment import (
     EligibilityToken,
@@ -22,6 +32,29 @@ from venmo_api.models.payment import (
 )
 from venmo_api.models.user import PaymentPrivacy, User
 
+_ALREADY_REMINDED_ERROR = 2907
+_NO_PENDING_PAYMENT_ERROR = 2901
+_NO_PENDING_PAYMENT_ERROR2 = 2905
+_NOT_ENOUGH_BALANCE_ERROR = 13006
+_OTP_STEP_UP_REQUIRED_ERROR = 1396
+
+_UPDATE_OK_ERROR_CODES = frozenset(
+    (_ALREADY_REMINDED_ERROR, _NO_PENDING_PAYMENT_ERROR, _NO_PENDING_PAYMENT_ERROR2)
+)
+_PAYMENT_OK_ERROR_CODES = frozenset(
+    (_OTP_STEP_UP_REQUIRED_ERROR, _NOT_ENOUGH_BALANCE_ERROR)
+)
+
+
+def to_cents(amount: float | int | str | Decimal) -> int:
+    """Convert a US dollar amount to integer cents, rounding half away from zero.
+    Goes through the decimal string so e.g. 2.675 gives 268, not float-rounded 267."""
+    if isinstance(amount, int):  # whole dollars, nothing to round
+        return amount * 100
+    return int(
+        (Decimal(str(amount)) * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+    )
+
 
 class PaymentApi:
     """
@@ -32,22 +65,44 @@ class PaymentApi:
         api_client (ApiClient): Logged in client instance to use for requests.
         balance (float | None, optional): User initial Venmo balance, if desired. Defaults
             to None.
+        user_api (UserApi | None, optional): If given, its cached balance is used
+            instead of `balance`, and is invalidated after a transfer so every reader
+            sees the same value. Defaults to None.
     """
 
+    __slots__ = (
+        "_profile",
+        "_balance",
+        "_user_api",
+        "_api_client",
+        "_default_pm_cache",
+        "_elig_cache",
+        "_transfer_dest_cache",
+    )
+
+    DEFAULT_PM_CACHE_TTL = 300  # seconds
+    TRANSFER_DEST_CACHE_TTL = 60  # seconds
+    ELIG_TOKEN_CACHE_TTL = 30  # seconds
+    ELIG_TOKEN_CACHE_SIZE = 64
+    PAGE_SIZE = 50
+
     def __init__(
-        self, profile: User, api_client: ApiClient, balance: float | None = None
+        self,
+        profile: User,
+        api_client: ApiClient,
+        balance: float | None = None,
+        user_api: UserApi | None = None,
     ):
         super().__init__()
         self._profile = profile
         self._balance = balance
+        self._user_api = user_api
         self._api_client = api_client
-        self._payment_error_codes = {
-            "already_reminded_error": 2907,
-            "no_pending_payment_error": 2901,
-            "no_pending_payment_error2": 2905,
-            "not_enough_balance_error": 13006,
-            "otp_step_up_required_error": 1396,
-        }
+        self._default_pm_cache: tuple[PaymentMethod, float] | None = None
+        self._elig_cache: dict[tuple[str, int, str], tuple[str, float]] = {}
+        self._transfer_dest_cache: dict[
+            str, tuple[Page[TransferDestination], float]
+        ] = {}
 
     def get_charge_payments(self, limit=100000) -> Page[Payment]:
         """Get a list of charge ongoing payments (pending request money)
@@ -89,10 +144,7 @@ class PaymentApi:
 
         # if the reminder has already sent
         if "error" in response.body:
-            if (
-                response.body["error"]["code"]
-                == self._payment_error_codes["no_pending_payment_error2"]
-            ):
+            if response.body["error"]["code"] == _NO_PENDING_PAYMENT_ERROR2:
                 raise NoPendingPaymentToUpdateError(payment_id, action)
             raise AlreadyRemindedPaymentError(payment_id=payment_id)
         return True
@@ -116,13 +168,57 @@ class PaymentApi:
             raise NoPendingPaymentToUpdateError(payment_id, action)
         return True
 
+    def remind_payments(
+        self, payment_ids: list[str], max_concurrency: int = 1
+    ) -> dict[str, bool | Exception]:
+        """Send reminders for many payments. A payment that's already reminded or no
+        longer pending doesn't stop the others, but any other error (e.g. an
+        HttpCodeError from Venmo refusing requests) aborts the batch and is raised.
+
+        Args:
+            payment_ids (list[str]): uuids of the payments, as returned by Payment.id.
+            max_concurrency (int, optional): Maximum requests in flight. Defaults to 1,
+                i.e. one after another. Venmo locks accounts that hit the API too
+                rapidly, so raise this with care (2 at most). Concurrent workers share
+                this client's requests.Session, which requests doesn't guarantee to be
+                thread-safe.
+
+        Raises:
+            HttpCodeError: or any other unexpected error, which stops the batch.
+
+        Returns:
+            dict[str, bool | Exception]: True or the per-payment error, per payment id.
+        """
+        return self._update_payments(self.remind_payment, payment_ids, max_concurrency)
+
+    def cancel_payments(
+        self, payment_ids: list[str], max_concurrency: int = 1
+    ) -> dict[str, bool | Exception]:
+        """Cancel many payments. A payment that's no longer pending doesn't stop the
+        others, but any other error (e.g. an HttpCodeError from Venmo refusing
+        requests) aborts the batch and is raised.
+
+        Args:
+            payment_ids (list[str]): uuids of the payments, as returned by Payment.id.
+            max_concurrency (int, optional): Maximum requests in flight. Defaults to 1,
+                i.e. one after another. Venmo locks accounts that hit the API too
+                rapidly, so raise this with care (2 at most). Concurrent workers share
+                this client's requests.Session, which requests doesn't guarantee to be
+                thread-safe.
+
+        Raises:
+            HttpCodeError: or any other unexpected error, which stops the batch.
+
+        Returns:
+            dict[str, bool | Exception]: True or the per-payment error, per payment id.
+        """
+        return self._update_payments(self.cancel_payment, payment_ids, max_concurrency)
+
     def get_payment_methods(self) -> Page[PaymentMethod]:
         """
         Get a list of available payment_methods
         """
-        response = self._api_client.call_api(
-            resource_path="/payment-methods", method="GET"
-        )
+        response = self._get_payment_methods_response()
         return deserialize(response=response, data_type=PaymentMethod)
 
     def send_money(
@@ -147,12 +243,11 @@ class PaymentApi:
         Returns:
             Payment: Either the transaction was successful or an exception will rise.
         """
-        return self._send_or_request_money(
-            amount=amount,
+        return self._do_send(
+            amount=abs(amount),
             note=note,
-            is_send_money=True,
-            funding_source_id=funding_source_id,
             target_user_id=target_user_id,
+            funding_source_id=funding_source_id,
             privacy_setting=privacy_setting.value,
         )
 
@@ -175,11 +270,9 @@ class PaymentApi:
         Returns:
             Payment: Either the transaction was successful or an exception will rise.
         """
-        return self._send_or_request_money(
-            amount=amount,
+        return self._do_request(
+            amount=-abs(amount),
             note=note,
-            is_send_money=False,
-            funding_source_id=None,
             target_user_id=target_user_id,
             privacy_setting=privacy_setting.value,
         )
@@ -196,14 +289,23 @@ class PaymentApi:
                 that charges a fee.
 
         Returns:
-            Page[TransferDestination]: list of eligible destinations.
+            Page[TransferDestination]: list of eligible destinations. Cached per
+                trans_type for `TRANSFER_DEST_CACHE_TTL` seconds.
         """
+        cached = self._transfer_dest_cache.get(trans_type)
+        if cached is not None:
+            destinations, fetched_at = cached
+            if time.monotonic() - fetched_at < self.TRANSFER_DEST_CACHE_TTL:
+                return destinations
+
         response = self._api_client.call_api(
             resource_path="/transfers/options", method="GET"
         )
-        return deserialize(
+        destinations = deserialize(
             response, TransferDestination, [trans_type, "eligible_destinations"]
         )
+        self._transfer_dest_cache[trans_type] = (destinations, time.monotonic())
+        return destinations
 
     def initiate_transfer(
         self,
@@ -217,8 +319,8 @@ class PaymentApi:
             destination_id (str): uuid of transfer destination, as returned by
                 TransferDestination.id.
             amount (float | None, optional): Amount in US dollars, gets rounded to 2
-                decimals internally. Defaults to None, in which case the entire Venmo
-                balance determined at initialization is used.
+                decimals internally. Defaults to None, in which case the entire current
+                Venmo balance is used.
             trans_type (Literal[&quot;standard&quot;, &quot;instant&quot;], optional):
                 'standard' is the free transfer that takes longer, 'instant' is the
                 quicker transfer that charges a fee. Defaults to "standard".
@@ -229,12 +331,12 @@ class PaymentApi:
         Returns:
             TransferPostResponse: object signifying successful transfer with details.
         """
-        if amount is None and self._balance is not None:
-            amount = self._balance
-        else:
-            raise ValueError("must pass a transfer amount if no balance available")
+        if amount is None:
+            amount = self._current_balance()
+            if amount is None:
+                raise ValueError("must pass a transfer amount if no balance available")
 
-        amount_cents = round(amount * 100)
+        amount_cents = to_cents(amount)
         body = {
             "amount": amount_cents,
             "destination_id": destination_id,
@@ -242,28 +344,61 @@ class PaymentApi:
             # TODO should this have a fee subtracted? don't feel like testing
             "final_amount": amount_cents,
         }
-        response = self._api_client.call_api(
-            resource_path="/transfers", body=body, method="POST"
-        )
+        try:
+            response = self._api_client.call_api(
+                resource_path="/transfers", body=body, method="POST"
+            )
+        except HttpCodeError:
+            # the cached destinations may be stale
+            self._transfer_dest_cache.clear()
+            raise
+
+        # the balance has moved, so don't let anything reuse the old one
+        self._balance = None
+        if self._user_api is not None:
+            self._user_api.invalidate_balance()
         return deserialize(response, TransferPostResponse)
 
+    def _current_balance(self) -> float | None:
+        if self._user_api is not None:
+            return self._user_api.get_my_balance()
+        return self._balance
+
     def get_default_payment_method(self) -> PaymentMethod:
         """
-        Search in all payment_methods and find the one that has payment_role of Default
+        Search in all payment_methods and find the one that has payment_role of Default.
+        The result is cached for `DEFAULT_PM_CACHE_TTL` seconds.
         """
-        payment_methods = self.get_payment_methods()
+        if self._default_pm_cache is not None:
+            p_method, fetched_at = self._default_pm_cache
+            if time.monotonic() - fetched_at < self.DEFAULT_PM_CACHE_TTL:
+                return p_method
 
-        for p_method in payment_methods:
-            if not p_method:
-                continue
+        response = self._get_payment_methods_response()
+        payment_methods = deserialize_lazy(response=response, data_type=PaymentMethod)
+        p_method = next(
+            (
+                p
+                for p in payment_methods
+                if p.peer_payment_role == PaymentMethodRole.DEFAULT
+            ),
+            None,
+        )
+        if p_method is None:
+            raise NoPaymentMethodFoundError()
 
-            if p_method.role == PaymentMethodRole.DEFAULT:
-                return p_method
+        self._default_pm_cache = (p_method, time.monotonic())
+        return p_method
 
-        raise NoPaymentMethodFoundError()
+    def invalidate_payment_method_cache(self):
+        """Forget the cached default payment method, so the next lookup refetches it."""
+        self._default_pm_cache = None
 
     # --- HELPERS ---
 
+    def _get_payment_methods_response(self) -> ValidatedResponse:
+        return self._api_client.get("/payment-methods")
+
     def _get_eligibility_token(
         self,
         amount: float,
@@ -296,13 +431,29 @@ class PaymentApi:
             "target_type": target_type,
             "note": note,
             "target_id": target_id,
-            "amount": round(amount * 100),
+            "amount": to_cents(amount),
         }
         response = self._api_client.call_api(
             resource_path="/protection/eligibility", body=body, method="POST"
         )
         return deserialize(response=response, data_type=EligibilityToken)
 
+    def _eligibility_token_for(self, amount: float, note: str, target_id: str) -> str:
+        """Eligibility token for this payment, reused for `ELIG_TOKEN_CACHE_TTL` seconds
+        so a retry (e.g. after NotEnoughBalanceError) skips the extra round trip. Tokens
+        are dropped once a payment goes through or the POST fails outright."""
+        key = (target_id, to_cents(amount), note)
+        cached = self._elig_cache.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        token = self._get_eligibility_token(amount, note, target_id).eligibility_token
+        if len(self._elig_cache) >= self.ELIG_TOKEN_CACHE_SIZE:
+            # dicts keep insertion order, so this drops the oldest entry
+            del self._elig_cache[next(iter(self._elig_cache))]
+        self._elig_cache[key] = (token, time.monotonic() + self.ELIG_TOKEN_CACHE_TTL)
+        return token
+
     def _update_payment(
         self, action: Literal["remind", "cancel"], payment_id: str
     ) -> ValidatedResponse:
@@ -310,87 +461,180 @@ class PaymentApi:
             resource_path=f"/payments/{payment_id}",
             body={"action": action},
             method="PUT",
-            ok_error_codes=list(self._payment_error_codes.values())[:-1],
+            ok_error_codes=_UPDATE_OK_ERROR_CODES,
         )
 
+    @staticmethod
+    def _update_payments(
+        update: Callable[[str], bool], payment_ids: list[str], max_concurrency: int
+    ) -> dict[str, bool | Exception]:
+        def run(payment_id: str) -> bool | Exception:
+            # only per-payment outcomes are collected; anything else (e.g. a 403 from
+            # Venmo starting to lock the account) must stop the batch
+            try:
+                return update(payment_id)
+            except (AlreadyRemindedPaymentError, NoPendingPaymentToUpdateError) as e:
+                return e
+
+        if max_concurrency <= 1:
+            return {payment_id: run(payment_id) for payment_id in payment_ids}
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            return dict(zip(payment_ids, executor.map(run, payment_ids)))
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown()
+
     def _get_payments(self, action: PaymentAction, limit: int) -> Page[Payment]:
         """
-        Helper method for getting a list of ongoing payments with the given action
+        Helper method for getting a list of ongoing payments with the given action, in
+        a single request for up to `limit` of them.
         """
-        parameters = {"action": action, "actor": self._profile.id, "limit": limit}
+        params = {"action": action, "actor": self._profile.id, "limit": limit}
         # TODO other params `status: pending,held`
-        response = self._api_client.call_api(
-            resource_path="/payments",
-            params=parameters,
-            method="GET",
-        )
+        response = self._api_client.get("/payments", params)
         return deserialize(response=response, data_type=Payment)
 
-    def _send_or_request_money(
+    def _iter_payments(
+        self, action: PaymentAction, page_size: int = PAGE_SIZE
+    ) -> Iterator[Page[Payment]]:
+        """Lazily fetch ongoing payments with the given action, one page per request, by
+        following the response's `pagination.next` link. If a full page comes back
+        without a usable next link, iteration stops with a warning, since more payments
+        may exist; use `get_charge_payments`/`get_pay_payments` to fetch them all.
+
+        TODO: private until the `pagination.next` format of /payments is verified
+        against a real response.
+
+        Args:
+            action (PaymentAction): "charge" or "pay".
+            page_size (int, optional): Number of payments requested per page. Defaults
+                to PAGE_SIZE.
+
+        Yields:
+            Page[Payment]: each non-empty page in turn.
+        """
+        host = self._api_client.host
+        resource_path = "/payments"
+        # TODO other params `status: pending,held`
+        params = {"action": action, "actor": self._profile.id, "limit": page_size}
+        while True:
+            response = self._api_client.get(resource_path, params)
+            page = deserialize(response=response, data_type=Payment)
+            if not page:
+                return
+            yield page
+
+            next_url = (response.body.get("pagination") or {}).get("next") or ""
+            # the next link carries its own query string, either absolute or relative
+            if next_url.startswith(host):
+                next_url = next_url.removeprefix(host)
+            elif next_url.startswith("/v1/"):
+                next_url = next_url.removeprefix("/v1")
+            elif not next_url.startswith("/"):
+                if len(page) >= page_size:
+                    warn(
+                        f"Stopped paging {action} payments after a full page with no "
+                        f"usable next link ({next_url or 'none'}), there may be more."
+                    )
+                return
+            resource_path, params = next_url, None
+
+    @staticmethod
+    def _base_body(
+        target_user_id: str, amount: float, note: str, privacy_setting: str
+    ) -> dict:
+        return {
+            "uuid": random_uuid4(),
+            "user_id": target_user_id,
+            "audience": privacy_setting,
+            "amount": to_cents(amount) / 100,
+            "note": note,
+        }
+
+    def _do_send(
         self,
         amount: float,
         note: str,
-        is_send_money: bool,
-        funding_source_id: str,
         target_user_id: str,
-        privacy_setting: PaymentPrivacy = PaymentPrivacy.PRIVATE,
+        funding_source_id: str | None,
+        privacy_setting: str = PaymentPrivacy.PRIVATE.value,
         eligibility_token: str | None = None,
     ) -> Payment:
         """
-        Helper method for sending and requesting money.
+        Helper method for sending money. `amount` must already be positive and
+        `privacy_setting` is the plain string value.
         """
+        if not funding_source_id:
+            funding_source_id = self.get_default_payment_method().id
+        if not eligibility_token:
+            eligibility_token = self._eligibility_token_for(
+                amount, note, target_user_id
+            )
+
+        body = self._base_body(target_user_id, amount, note, privacy_setting)
+        body["eligibility_token"] = eligibility_token
+        body["funding_source_id"] = funding_source_id
+
+        elig_key = (target_user_id, to_cents(amount), note)
+        try:
+            payment = self._post_payment(body, amount, target_user_id)
+        except HttpCodeError:
+            # the cached funding source or eligibility token may be stale
+            self.invalidate_payment_method_cache()
+            self._elig_cache.pop(elig_key, None)
+            raise
+
+        # the payment went through, so the token is spent
+        self._elig_cache.pop(elig_key, None)
+        return payment
+
+    def _do_request(
+        self,
+        amount: float,
+        note: str,
+        target_user_id: str,
+        privacy_setting: str = PaymentPrivacy.PRIVATE.value,
+    ) -> Payment:
+        """
+        Helper method for requesting money. `amount` must already be negative and
+        `privacy_setting` is the plain string value.
+        """
+        body = self._base_body(target_user_id, amount, note, privacy_setting)
+        return self._post_payment(body, amount, target_user_id)
 
-        amount = abs(amount)
-        if not is_send_money:
-            amount = -amount
-
-        body = {
-            "uuid": str(uuid.uuid4()),
-            "user_id": target_user_id,
-            "audience": privacy_setting,
-            "amount": round(amount, 2),
-            "note": note,
-        }
-
-        if is_send_money:
-            if not funding_source_id:
-                funding_source_id = self.get_default_payment_method().id
-            if not eligibility_token:
-                eligibility_token = self._get_eligibility_token(
-                    amount, note, target_user_id
-                ).eligibility_token
-            body.update({"eligibility_token": eligibility_token})
-            body.update({"funding_source_id": funding_source_id})
-
+    def _post_payment(self, body: dict, amount: float, target_user_id: str) -> Payment:
+        """
+        POST a payment body and turn in-band error codes into exceptions.
+        """
         response = self._api_client.call_api(
             resource_path="/payments",
             method="POST",
             body=body,
-            ok_error_codes=[
-                self._payment_error_codes["otp_step_up_required_error"],
-                self._payment_error_codes["not_enough_balance_error"],
-            ],
+            ok_error_codes=_PAYMENT_OK_ERROR_CODES,
         )
 
         # handle 200 status code errors
-        error_code = None
-        try:
-            error_code = response.body.get("error").get("code")
-        except:
-            pass
+        response_body = response.body
+        error = response_body.get("error") if isinstance(response_body, dict) else None
+        error_code = error.get("code") if isinstance(error, dict) else None
 
         if error_code:
-            if error_code == self._payment_error_codes["otp_step_up_required_error"]:
+            if error_code == _OTP_STEP_UP_REQUIRED_ERROR:
                 raise RuntimeError(
                     "OTP step-up required for payment to go through, log out and try "
                     "again on an actual device."
                 )
 
-            elif error_code == self._payment_error_codes["not_enough_balance_error"]:
+            elif error_code == _NOT_ENOUGH_BALANCE_ERROR:
                 raise NotEnoughBalanceError(amount, target_user_id)
 
-            error = response.body["data"]
-            raise GeneralPaymentError(f"{error.get('title')}\n{error.get('error_msg')}")
+            error_data = response_body["data"]
+            raise GeneralPaymentError(
+                f"{error_data.get('title')}\n{error_data.get('error_msg')}"
+            )
 
         # if no exception raises, then it was successful
         return deserialize(response, Payment, nested_response=["payment"])
@@ -1,9 +1,13 @@
+from collections.abc import Iterator
+
 from venmo_api.apis.api_client import ApiClient
-from venmo_api.apis.api_util import ValidatedResponse, deserialize
+from venmo_api.apis.api_util import ValidatedResponse, deserialize, deserialize_json
 from venmo_api.models.page import Page
 from venmo_api.models.transaction import Transaction
 from venmo_api.models.user import User
 
+_BOOL_STR = {True: "true", False: "false"}
+
 
 class UserApi:
     """API for querying users and transactions.
@@ -12,6 +16,8 @@ class UserApi:
         api_client (ApiClient): Logged in client instance to use for requests.
     """
 
+    __slots__ = ("__api_client", "_profile", "_balance")
+
     def __init__(self, api_client: ApiClient):
         super().__init__()
         self.__api_client = api_client
@@ -28,11 +34,10 @@ class UserApi:
         Returns:
             User: Your profile.
         """
-        if self._profile and not force_update:
+        if self._profile is not None and not force_update:
             return self._profile
 
-        response = self.__api_client.call_api(resource_path="/account", method="GET")
-        self._profile = deserialize(response, User, nested_response=["user"])
+        self._fetch_account()
         return self._profile
 
     def get_my_balance(self, force_update=False) -> float:
@@ -45,13 +50,23 @@ class UserApi:
         Returns:
             float: Your balance
         """
-        if self._balance and not force_update:
+        if self._balance is not None and not force_update:
             return self._balance
 
-        response = self.__api_client.call_api(resource_path="/account", method="GET")
-        self._balance = deserialize(response, float, nested_response=["balance"])
+        self._fetch_account()
         return self._balance
 
+    def invalidate_balance(self):
+        """Drop the cached balance, e.g. after a transfer, so the next
+        `get_my_balance` refetches it."""
+        self._balance = None
+
+    def _fetch_account(self):
+        """/account returns both profile and balance, so cache both from one request."""
+        response = self.__api_client.get("/account")
+        self._profile = deserialize(response, User, nested_response=["user"])
+        self._balance = deserialize(response, float, nested_response=["balance"])
+
     # --- USERS ---
 
     def search_for_users(
@@ -78,10 +93,8 @@ class UserApi:
         if username or "@" in query:
             params.update({"query": query.replace("@", ""), "type": "username"})
 
-        response = self.__api_client.call_api(
-            resource_path="/users", params=params, method="GET"
-        )
-        return deserialize(response=response, data_type=User).set_method(
+        response = self.__api_client.get("/users", params)
+        return deserialize_json(response, User, many=True).set_method(
             method=self.search_for_users,
             kwargs={"query": query, "limit": limit},
             current_offset=offset,
@@ -96,29 +109,38 @@ class UserApi:
         Returns:
             User | None: the corresponding User, if any.
         """
-        response = self.__api_client.call_api(
-            resource_path=f"/users/{user_id}", method="GET"
-        )
+        response = self.__api_client.get(f"/users/{user_id}")
         try:
-            return deserialize(response=response, data_type=User)
+            return deserialize_json(response, User)
         except Exception:
             return None
 
-    def get_user_by_username(self, username: str) -> User | None:
+    def get_user_by_username(
+        self, username: str, page_size: int = 50, max_pages: int = 0
+    ) -> User | None:
         """Search for the user profile with [username]
 
         Args:
             username (str): username of User.
+            page_size (int, optional): Number of search results per request. Defaults
+                to 50.
+            max_pages (int, optional): Extra search pages to request, one at a time,
+                if the first full page has no exact match. Defaults to 0, i.e. a single
+                request, since Venmo rate-limits aggressively.
 
         Returns:
             User | None: The corresponding User, if any.
         """
-        users = self.search_for_users(query=username, username=True)
-        for user in users:
-            if user.username == username:
-                return user
-
-        # username not found
+        offset = 0
+        for _ in range(max_pages + 1):
+            users = self.search_for_users(
+                query=username, offset=offset, limit=page_size, username=True
+            )
+            match = next((user for user in users if user.username == username), None)
+            # a short page means the search has nothing further
+            if match is not None or len(users) < page_size:
+                return match
+            offset += page_size
         return None
 
     def get_user_friends_list(
@@ -138,10 +160,8 @@ class UserApi:
             Page[User]: A list of User objects or empty if no friends :(
         """
         params = {"limit": limit, "offset": offset}
-        response = self.__api_client.call_api(
-            resource_path=f"/users/{user_id}/friends", method="GET", params=params
-        )
-        return deserialize(response=response, data_type=User).set_method(
+        response = self.__api_client.get(f"/users/{user_id}/friends", params)
+        return deserialize_json(response, User, many=True).set_method(
             method=self.get_user_friends_list,
             kwargs={"user_id": user_id, "limit": limit},
             current_offset=offset,
@@ -176,7 +196,7 @@ class UserApi:
         response = self._get_transactions(
             user_id, social_only, public_only, limit, before_id
         )
-        return deserialize(response, Transaction).set_method(
+        return deserialize_json(response, Transaction, many=True).set_method(
             method=self.get_user_transactions,
             kwargs={
                 "user_id": user_id,
@@ -211,7 +231,7 @@ class UserApi:
         response = self._get_transactions(
             "friends", social_only, public_only, limit, before_id
         )
-        return deserialize(response, Transaction).set_method(
+        return deserialize_json(response, Transaction, many=True).set_method(
             method=self.get_friends_transactions,
             kwargs={
                 "social_only": social_only,
@@ -254,7 +274,7 @@ class UserApi:
             limit,
             before_id,
         )
-        return deserialize(response, Transaction).set_method(
+        return deserialize_json(response, Transaction, many=True).set_method(
             method=self.get_transaction_between_two_users,
             kwargs={
                 "user_id_one": user_id_one,
@@ -265,6 +285,65 @@ class UserApi:
             },
         )
 
+    def iter_user_transactions(
+        self,
+        user_id: str,
+        social_only: bool = False,
+        public_only: bool = True,
+        limit: int = 50,
+    ) -> Iterator[Page[Transaction]]:
+        """Lazily page through [user_id]'s transactions visible to you, requesting each
+        page only once the previous one has been consumed.
+
+        Args:
+            user_id (str): uuid for user, as returned by User.id.
+            social_only (bool, optional): see `get_user_transactions`. Defaults to
+                False.
+            public_only (bool, optional): see `get_user_transactions`. Defaults to True.
+            limit (int, optional): Maximum number of entries per page. Defaults to 50.
+
+        Yields:
+            Page[Transaction]: each non-empty page in turn.
+        """
+        return self._iter_transaction_pages(user_id, social_only, public_only, limit)
+
+    def iter_friends_transactions(
+        self,
+        social_only: bool = False,
+        public_only: bool = True,
+        limit: int = 50,
+    ) -> Iterator[Page[Transaction]]:
+        """Lazily page through your friends' transactions visible to you, one request
+        per page like `iter_user_transactions`.
+
+        Args:
+            social_only (bool, optional): see `get_user_transactions`. Defaults to
+                False.
+            public_only (bool, optional): see `get_user_transactions`. Defaults to True.
+            limit (int, optional): Maximum number of entries per page. Defaults to 50.
+
+        Yields:
+            Page[Transaction]: each non-empty page in turn.
+        """
+        return self._iter_transaction_pages("friends", social_only, public_only, limit)
+
+    def _iter_transaction_pages(
+        self, endpoint_suffix: str, social_only: bool, public_only: bool, limit: int
+    ) -> Iterator[Page[Transaction]]:
+        before_id = None
+        while True:
+            response = self._get_transactions(
+                endpoint_suffix, social_only, public_only, limit, before_id
+            )
+            page = deserialize_json(response, Transaction, many=True)
+            if not page:
+                return
+            yield page
+            # a short page is the last one, don't spend a request confirming it
+            if len(page) < limit:
+                return
+            before_id = page[-1].id
+
     def _get_transactions(
         self,
         endpoint_suffix: str,
@@ -276,16 +355,14 @@ class UserApi:
         """ """
         params = {
             "limit": limit,
-            "social_only": str(social_only).lower(),
-            "only_public_stories": str(public_only).lower(),
+            "social_only": _BOOL_STR[social_only],
+            "only_public_stories": _BOOL_STR[public_only],
         }
         if before_id:
             params["before_id"] = before_id
 
         # Make the request
-        response = self.__api_client.call_api(
-            resource_path=f"/stories/target-or-actor/{endpoint_suffix}",
-            method="GET",
-            params=params,
+        response = self.__api_client.get(
+            f"/stories/target-or-actor/{endpoint_suffix}", params
         )
         return response
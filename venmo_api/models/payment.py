@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import StrEnum, auto
 from typing import Annotated, Any, Literal
 
-from pydantic import AfterValidator, AliasPath, BaseModel, Field
+from pydantic import AfterValidator, AliasChoices, AliasPath, BaseModel, Field
 
 from venmo_api.models.user import PaymentPrivacy, User
 
@@ -74,7 +74,9 @@ class Payment(BaseModel):
     date_created: datetime
     audience: PaymentPrivacy | None = None
     note: str
-    target: User = Field(validation_alias=AliasPath("target", "user"))
+    target: User = Field(
+        validation_alias=AliasChoices(AliasPath("target", "user"), "target")
+    )
     actor: User
     date_completed: datetime | None
     date_reminded: datetime | None
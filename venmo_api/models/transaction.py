@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Annotated, Literal
 
-from pydantic import AliasPath, BaseModel, BeforeValidator, Field
+from pydantic import AliasChoices, AliasPath, BaseModel, BeforeValidator, Field
 
 from venmo_api.models.payment import Payment
 from venmo_api.models.user import PaymentPrivacy, User
@@ -16,15 +16,16 @@ def get_device_model_from_json(app_json: dict):
     :param app_json:
     :return:
     """
-    _id = 0
-    if app_json:
-        _id = app_json["id"]
-
-    return DEVICE_MAP.get(int(_id))
+    if not app_json:
+        return "Other"
+    _id = app_json["id"]
+    # ids usually come back as ints already, skip the cast for those
+    return DEVICE_MAP.get(_id if type(_id) is int else int(_id), "Other")
 
 
 DeviceModel = Annotated[
-    Literal["iPhone", "Android", "Other"], BeforeValidator(get_device_model_from_json)
+    Literal["iPhone", "Android", "Desktop Browser", "Other"],
+    BeforeValidator(get_device_model_from_json),
 ]
 
 
@@ -53,7 +54,9 @@ class Comment(BaseModel):
     id: str
     message: str
     date_created: datetime
-    mentions: list[Mention] = Field(validation_alias=AliasPath("mentions", "data"))
+    mentions: list[Mention] = Field(
+        validation_alias=AliasChoices(AliasPath("mentions", "data"), "mentions")
+    )
     user: User
 
 
@@ -68,4 +71,6 @@ class Transaction(BaseModel):
     payment: Payment
     audience: PaymentPrivacy
     device_used: DeviceModel = Field(validation_alias="app")
-    comments: list[Comment] = Field(validation_alias=AliasPath("comments", "data"))
+    comments: list[Comment] = Field(
+        validation_alias=AliasChoices(AliasPath("comments", "data"), "comments")
+    )
@@ -26,13 +26,14 @@ class IdentityType(StrEnum):
     def _missing_(cls, value):  # type: ignore[override]
         """Gracefully handle new/unknown identity types coming from the API."""
         if isinstance(value, str):
-            for member in cls:
-                if member.value == value.lower():
-                    return member
-            return cls.UNKNOWN
+            return _IDENTITY_TYPES.get(value.lower(), cls.UNKNOWN)
         return None
 
 
+# value -> member, for case-insensitive lookups in IdentityType._missing_
+_IDENTITY_TYPES = {member.value: member for member in IdentityType}
+
+
 class User(BaseModel):
     about: str
     date_joined: datetime
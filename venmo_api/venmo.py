@@ -1,4 +1,5 @@
 import os
+import time
 from typing import Self
 
 from venmo_api import ApiClient, AuthenticationApi, PaymentApi, UserApi
@@ -55,7 +56,9 @@ class Client:
         access_token = AuthenticationApi(api_client).login_with_credentials_cli(
             username=username, password=password
         )
-        return Client(api_client=api_client)
+        client = Client(api_client=api_client)
+        client._owns_api_client = True  # created here, so the Client closes it
+        return client
 
     @staticmethod
     def logout(access_token) -> bool:
@@ -83,10 +86,13 @@ class Client:
             device_id (str | None, optional):  A valid device-id. Defaults to None. This
                 is only optional because you can choose to pass an initialized ApiClient
                 holding the id instead.
-            api_client (ApiClient | None, optional): Alternative to the above 2.
+            api_client (ApiClient | None, optional): Alternative to the above 2. It's
+                left open on exiting a `with` block, since the caller owns it.
                 Defaults to None.
         """
         super().__init__()
+        # an injected ApiClient belongs to the caller, so __exit__ leaves it open
+        self._owns_api_client = api_client is None
         if api_client is None:
             self.__api_client = ApiClient(
                 access_token=access_token, device_id=device_id
@@ -103,40 +109,56 @@ class Client:
 
         self.user = UserApi(self.__api_client)
         self._profile = self.user.get_my_profile()
-        self._balance = self.user.get_my_balance()
+        self._account_fetched_at = time.monotonic()
+        # the balance cache lives in UserApi, which PaymentApi invalidates on transfers
         self.payment = PaymentApi(
-            profile=self._profile, api_client=self.__api_client, balance=self._balance
+            profile=self._profile, api_client=self.__api_client, user_api=self.user
         )
 
-    def my_profile(self, force_update=False) -> User:
+    def my_profile(self, force_update=False, max_age: float | None = None) -> User:
         """Get your profile info. It can be cached from the previous time.
 
         Args:
             force_update (bool, optional): Whether to force fetching an updated user.
                 Defaults to False.
+            max_age (float | None, optional): Refetch if the cached copy is older than
+                this many seconds. Defaults to None, i.e. never expires.
 
         Returns:
             User: your profile.
         """
-        if force_update:
-            self._profile = self.user.get_my_profile(force_update=force_update)
+        if force_update or self._account_is_stale(max_age):
+            self._refresh_account()
 
         return self._profile
 
-    def my_balance(self, force_update=False) -> float:
+    def my_balance(self, force_update=False, max_age: float | None = None) -> float:
         """Get your Venmo balance. It can be cached from the previous time.
 
         Args:
             force_update (bool, optional): Whether to force fetching an updated balance.
                 Defaults to False.
+            max_age (float | None, optional): Refetch if the cached copy is older than
+                this many seconds. Defaults to None, i.e. never expires.
 
         Returns:
             float: your balance.
         """
-        if force_update:
-            self._balance = self.user.get_my_balance(force_update=force_update)
+        if force_update or self._account_is_stale(max_age):
+            self._refresh_account()
 
-        return self._balance
+        return self.user.get_my_balance()
+
+    def _account_is_stale(self, max_age: float | None) -> bool:
+        return (
+            max_age is not None
+            and time.monotonic() - self._account_fetched_at > max_age
+        )
+
+    def _refresh_account(self):
+        """Profile and balance come from the same /account request, so refresh both."""
+        self._profile = self.user.get_my_profile(force_update=True)
+        self._account_fetched_at = time.monotonic()
 
     @property
     def access_token(self) -> str | None:
@@ -147,7 +169,11 @@ class Client:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.log_out_instance()
+        try:
+            self.log_out_instance()
+        finally:
+            if self._owns_api_client:
+                self.__api_client.close()
 
     def log_out_instance(self) -> bool:
         """Convenience instance method for logging out using stored access token. Called